@@ -24,7 +24,8 @@ from litex.build import tools
 
 class AlteraQuartusToolchain(GenericToolchain):
     attr_translate = {
-        "keep": ("keep", 1),
+        "keep":        ("keep", 1),
+        "fsm_one_hot": ("syn_encoding", "one-hot"),
     }
 
     def __init__(self):
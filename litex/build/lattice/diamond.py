@@ -30,6 +30,7 @@ class LatticeDiamondToolchain(GenericToolchain):
     attr_translate = {
         "keep":             ("syn_keep", "true"),
         "no_retiming":      ("syn_no_retiming", "true"),
+        "fsm_one_hot":      ("syn_encoding", "onehot"),
     }
 
     special_overrides = common.lattice_ecp5_special_overrides
@@ -76,6 +76,7 @@ class LatticeRadiantToolchain(GenericToolchain):
     attr_translate = {
         "keep":             ("syn_keep", "true"),
         "no_retiming":      ("syn_no_retiming", "true"),
+        "fsm_one_hot":      ("syn_encoding", "onehot"),
     }
 
     special_overrides = common.lattice_NX_special_overrides
@@ -94,7 +94,8 @@ class XilinxVivadoToolchain(GenericToolchain):
         "mr_ff":           ("mr_ff",      "true"), # user-defined attribute
         "ars_ff1":         ("ars_ff1",    "true"), # user-defined attribute
         "ars_ff2":         ("ars_ff2",    "true"), # user-defined attribute
-        "no_shreg_extract": None
+        "no_shreg_extract": None,
+        "fsm_one_hot":     ("fsm_encoding", "one_hot"),
     }
 
     def __init__(self):
@@ -0,0 +1,18 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen.genlib.fsm import FSM
+
+# One-Hot FSM --------------------------------------------------------------------------------------
+
+class OneHotFSM(FSM):
+    """FSM whose state register is tagged for one-hot encoding by the synthesis toolchain.
+
+    The "fsm_one_hot" attribute is translated by the toolchains that support it (Vivado, Quartus,
+    Diamond, Radiant) and ignored by the others. RTL behaviour is identical to a regular FSM.
+    """
+    def do_finalize(self):
+        FSM.do_finalize(self)
+        self.state.attr.add("fsm_one_hot")
@@ -11,6 +11,7 @@ from migen import *
 from migen.genlib.roundrobin import *
 
 from litex.gen import *
+from litex.gen.genlib.fsm import OneHotFSM
 
 from litex.soc.interconnect import stream
 
@@ -112,11 +113,24 @@ class Header:
         self.fields = fields
         self.length = length
         self.swap_field_bytes = swap_field_bytes
+        self._slices       = None
+        self._byte_map     = None
+        self._byte_aligned = None
+
+    def get_slices(self):
+        # Sorted (name, start, end, width) list, computed once since fields are constant for a Header.
+        if self._slices is None:
+            self._slices = []
+            for k, v in sorted(self.fields.items()):
+                start = v.byte*8 + v.offset
+                end   = start + v.width
+                self._slices.append((k, start, end, v.width))
+        return self._slices
 
     def get_layout(self):
         layout = []
-        for k, v in sorted(self.fields.items()):
-            layout.append((k, v.width))
+        for k, start, end, width in self.get_slices():
+            layout.append((k, width))
         return layout
 
     def get_field(self, obj, name, width):
@@ -130,23 +144,75 @@ class Header:
             raise ValueError("Width mismatch on " + name + " field")
         return field
 
-    def encode(self, obj, signal):
-        r = []
-        for k, v in sorted(self.fields.items()):
-            start = v.byte*8 + v.offset
-            end = start + v.width
-            field = self.get_field(obj, k, v.width)
+    def is_byte_aligned(self):
+        # True when all fields are byte-aligned, non-overlapping and fit in the header. Computed once
+        # since fields are constant for a Header.
+        if self._byte_aligned is None:
+            self._byte_map     = self._compute_byte_map()
+            self._byte_aligned = self._byte_map is not None
+        return self._byte_aligned
+
+    def get_byte_map(self):
+        # (name, field byte, header byte) list, only available on byte-aligned headers.
+        if not self.is_byte_aligned():
+            raise ValueError("Header is not byte-aligned, no byte map available")
+        return self._byte_map
+
+    def _compute_byte_map(self):
+        # Returns the (name, field byte, header byte) list, or None when the header is not byte-aligned.
+        byte_map = []
+        used     = set()
+        for k, start, end, width in self.get_slices():
+            if (start%8) or (width%8) or (end > self.length*8):
+                return None
+            for i in range(width//8):
+                n = start//8 + ((width//8 - 1 - i) if self.swap_field_bytes else i)
+                if n in used:
+                    return None
+                used.add(n)
+                byte_map.append((k, i, n))
+        return byte_map
+
+    def _encode_bytes(self, obj, signal):
+        # Place each field byte at its header position and assign the whole header with a single Cat
+        # (byte swapping is folded into the placement).
+        fields       = {k: self.get_field(obj, k, width) for k, start, end, width in self.get_slices()}
+        header_bytes = [C(0, 8)]*self.length
+        for k, i, n in self.get_byte_map():
+            header_bytes[n] = fields[k][8*i:8*(i+1)]
+        return [signal.eq(Cat(*header_bytes))]
+
+    def _encode_runs(self, obj, signal):
+        # Group contiguous fields into runs and assign each run with a single Cat.
+        slices = sorted(self.get_slices(), key=lambda s: s[1])
+        # Overlapping fields: keep field name order so assignment priority on shared bits is unchanged.
+        if any(a[2] > b[1] for a, b in zip(slices, slices[1:])):
+            slices = self.get_slices()
+        runs = []
+        for k, start, end, width in slices:
+            field = self.get_field(obj, k, width)
             if self.swap_field_bytes:
                 field = reverse_bytes(field)
-            r.append(signal[start:end].eq(field))
+            if runs and runs[-1][1] == start:
+                runs[-1][1] = end
+                runs[-1][2].append(field)
+            else:
+                runs.append([start, end, [field]])
+        r = []
+        for start, end, fields in runs:
+            r.append(signal[start:end].eq(Cat(*fields)))
         return r
 
+    def encode(self, obj, signal):
+        if self.is_byte_aligned():
+            return self._encode_bytes(obj, signal)
+        else:
+            return self._encode_runs(obj, signal)
+
     def decode(self, signal, obj):
         r = []
-        for k, v in sorted(self.fields.items()):
-            start = v.byte*8 + v.offset
-            end = start + v.width
-            field = self.get_field(obj, k, v.width)
+        for k, start, end, width in self.get_slices():
+            field = self.get_field(obj, k, width)
             if self.swap_field_bytes:
                 r.append(field.eq(reverse_bytes(signal[start:end])))
             else:
@@ -170,61 +236,70 @@ class Packetizer(LiteXModule):
         header_leftover = header.length%bytes_per_clk
         aligned         = header_leftover == 0
 
+        # States (Resolved at elaboration: skip HEADER-SEND when the header fits in one beat).
+        data_copy_state   = "ALIGNED-DATA-COPY" if aligned else "UNALIGNED-DATA-COPY"
+        header_next_state = data_copy_state if header_words == 1 else "HEADER-SEND"
+
         # Signals.
-        sr       = Signal(header.length*8, reset_less=True)
-        sr_load  = Signal()
-        sr_shift = Signal()
-        count    = Signal(max=max(header_words, 2))
-        sink_d   = stream.Endpoint(sink_description)
+        header_load = Signal()
+        source_beat = Signal()
+        sink_d      = stream.Endpoint(sink_description)
 
-        # Header Encode/Load/Shift.
+        # Header Encode/Load (Header register only required for HEADER-SEND/Unaligned leftover).
         self.comb += header.encode(sink, self.header)
-        self.sync += If(sr_load, sr.eq(self.header))
-        if header_words != 1:
-            self.sync += If(sr_shift, sr.eq(sr[data_width:]))
+        if (header_words != 1) or (not aligned):
+            header_reg = Signal(header.length*8, reset_less=True)
+            self.sync += If(header_load, header_reg.eq(self.header))
 
-        # FSM.
-        self.fsm = fsm = FSM(reset_state="IDLE")
+        # Shared Conditions.
+        self.comb += source_beat.eq(source.valid & source.ready)
+
+        # FSM (One-Hot encoded to keep source.data/last muxes directly selected by state bits).
+        self.fsm = fsm = OneHotFSM(reset_state="IDLE")
         fsm_from_idle = Signal()
         fsm.act("IDLE",
             sink.ready.eq(1),
-            NextValue(count, 1),
             If(sink.valid,
                 sink.ready.eq(0),
                 source.valid.eq(1),
                 source.last.eq(0),
                 source.data.eq(self.header[:data_width]),
-                If(source.valid & source.ready,
-                    sr_load.eq(1),
+                If(source_beat,
+                    header_load.eq(1),
                     NextValue(fsm_from_idle, 1),
-                    If(header_words == 1,
-                        NextState("ALIGNED-DATA-COPY" if aligned else "UNALIGNED-DATA-COPY")
-                    ).Else(
-                        NextState("HEADER-SEND")
-                    )
+                    NextState(header_next_state)
                )
             )
         )
-        fsm.act("HEADER-SEND",
-            source.valid.eq(1),
-            source.last.eq(0),
-            source.data.eq(sr[min(data_width, len(sr)-1):]),
-            If(source.valid & source.ready,
-                sr_shift.eq(1),
-                If(count == (header_words - 1),
-                    sr_shift.eq(0),
-                    NextState("ALIGNED-DATA-COPY" if aligned else "UNALIGNED-DATA-COPY"),
-                    NextValue(count, count + 1)
-               ).Else(
-                    NextValue(count, count + 1),
-               )
+        if header_words != 1:
+            # One-Hot Header Word Select (Word 0 is sent from IDLE: bit i selects header word i + 1).
+            header_sel  = Signal(max(header_words - 1, 1))
+            header_last = Signal()
+            header_word = Signal(data_width)
+            self.comb += header_last.eq(header_sel[-1])
+            self.comb += header_word.eq(Reduce("OR", [
+                Replicate(header_sel[i], data_width) & header_reg[(i + 1)*data_width:(i + 2)*data_width]
+                for i in range(len(header_sel))
+            ]))
+            fsm.act("IDLE",
+                NextValue(header_sel, 1)
+            )
+            fsm.act("HEADER-SEND",
+                source.valid.eq(1),
+                source.last.eq(0),
+                source.data.eq(header_word),
+                If(source_beat,
+                    NextValue(header_sel, header_sel << 1),
+                    If(header_last,
+                        NextState(data_copy_state)
+                    )
+                )
             )
-        )
         fsm.act("ALIGNED-DATA-COPY",
             source.valid.eq(sink.valid),
             source.last.eq(sink.last),
             source.data.eq(sink.data),
-            If(source.valid & source.ready,
+            If(source_beat,
                sink.ready.eq(1),
                If(source.last,
                   NextState("IDLE")
@@ -232,18 +307,17 @@ class Packetizer(LiteXModule):
             )
         )
         if not aligned:
-            header_offset_multiplier = 1 if header_words == 1 else 2
             self.sync += If(source.ready, sink_d.eq(sink))
             fsm.act("UNALIGNED-DATA-COPY",
                 source.valid.eq(sink.valid | sink_d.last),
                 source.last.eq(sink_d.last),
                 If(fsm_from_idle,
-                    source.data[:max(header_leftover*8, 1)].eq(sr[min(header_offset_multiplier*data_width, len(sr)-1):])
+                    source.data[:max(header_leftover*8, 1)].eq(header_reg[min(header_words*data_width, len(header_reg)-1):])
                 ).Else(
                     source.data[:max(header_leftover*8, 1)].eq(sink_d.data[min((bytes_per_clk-header_leftover)*8, data_width-1):])
                 ),
                 source.data[header_leftover*8:].eq(sink.data),
-                If(source.valid & source.ready,
+                If(source_beat,
                     sink.ready.eq(~source.last),
                     NextValue(fsm_from_idle, 0),
                     If(source.last,
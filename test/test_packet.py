@@ -25,8 +25,39 @@ packet_header = Header(
     length           = packet_header_length,
     swap_field_bytes = True)
 
-def packet_description(dw):
-    param_layout = packet_header.get_layout()
+# Header with non byte-aligned fields (similar to IPv4 version/ihl).
+bitfield_header_length = 8
+bitfield_header_fields = {
+    "field_4b_lo" : HeaderField(0, 0,  4),
+    "field_4b_hi" : HeaderField(0, 4,  4),
+    "field_16b"   : HeaderField(1, 0, 16),
+    "field_3b"    : HeaderField(3, 0,  3),
+    "field_5b"    : HeaderField(3, 3,  5),
+    "field_1b"    : HeaderField(4, 0,  1),
+    "field_7b"    : HeaderField(4, 1,  7),
+    "field_24b"   : HeaderField(5, 0, 24),
+}
+
+# Header filling exactly one 128-bit beat (aligned, single header word).
+single_beat_header_length = 16
+single_beat_header_fields = {
+    "field_8b"  : HeaderField(0, 0,  8),
+    "field_16b" : HeaderField(1, 0, 16),
+    "field_32b" : HeaderField(3, 0, 32),
+    "field_64b" : HeaderField(7, 0, 64),
+}
+
+# Header spanning exactly two 32-bit beats (one word sent from HEADER-SEND).
+two_beats_header_length = 8
+two_beats_header_fields = {
+    "field_8b"  : HeaderField(0, 0,  8),
+    "field_16b" : HeaderField(1, 0, 16),
+    "field_32b" : HeaderField(3, 0, 32),
+    "field_8b2" : HeaderField(7, 0,  8),
+}
+
+def packet_description(dw, header=packet_header):
+    param_layout = header.get_layout()
     payload_layout = [("data", dw)]
     return EndpointDescription(payload_layout, param_layout)
 
@@ -41,29 +72,24 @@ class Packet:
 
 
 class TestPacket(unittest.TestCase):
-    def loopback_test(self, dw):
+    def loopback_test(self, dw, header=packet_header):
         prng = random.Random(42)
+        fields = sorted(header.fields.keys())
         # Prepare packets
         npackets = 8
         packets  = []
         for n in range(npackets):
-            header               = {}
-            header["field_8b"]   = prng.randrange(2**8)
-            header["field_16b"]  = prng.randrange(2**16)
-            header["field_32b"]  = prng.randrange(2**32)
-            header["field_64b"]  = prng.randrange(2**64)
-            header["field_128b"] = prng.randrange(2**128)
+            values = {}
+            for field in fields:
+                values[field] = prng.randrange(2**header.fields[field].width)
             datas = [prng.randrange(2**dw) for _ in range(prng.randrange(2**7))]
-            packets.append(Packet(header, datas))
+            packets.append(Packet(values, datas))
 
         def generator(dut, valid_rand=50):
             # Send packets
             for packet in packets:
-                yield dut.sink.field_8b.eq(packet.header["field_8b"])
-                yield dut.sink.field_16b.eq(packet.header["field_16b"])
-                yield dut.sink.field_32b.eq(packet.header["field_32b"])
-                yield dut.sink.field_64b.eq(packet.header["field_64b"])
-                yield dut.sink.field_128b.eq(packet.header["field_128b"])
+                for field in fields:
+                    yield getattr(dut.sink, field).eq(packet.header[field])
                 yield
                 for n, data in enumerate(packet.datas):
                     yield dut.sink.valid.eq(1)
@@ -92,7 +118,7 @@ class TestPacket(unittest.TestCase):
                         yield
                     yield dut.source.ready.eq(1)
                     yield
-                    for field in ["field_8b", "field_16b", "field_32b", "field_64b", "field_128b"]:
+                    for field in fields:
                         if (yield getattr(dut.source, field)) != packet.header[field]:
                             dut.header_errors += 1
                     #print("{:x} vs {:x}".format((yield dut.source.data), data))
@@ -104,8 +130,8 @@ class TestPacket(unittest.TestCase):
 
         class DUT(Module):
             def __init__(self):
-                packetizer   = Packetizer(packet_description(dw), raw_description(dw), packet_header)
-                depacketizer = Depacketizer(raw_description(dw), packet_description(dw), packet_header)
+                packetizer   = Packetizer(packet_description(dw, header), raw_description(dw), header)
+                depacketizer = Depacketizer(raw_description(dw), packet_description(dw, header), header)
                 self.submodules += packetizer, depacketizer
                 self.comb += packetizer.source.connect(depacketizer.sink)
                 self.sink, self.source = packetizer.sink, depacketizer.source
@@ -127,3 +153,17 @@ class TestPacket(unittest.TestCase):
 
     def test_128bit_loopback(self):
         self.loopback_test(dw=128)
+
+    def test_bitfield_header_loopback(self):
+        for swap_field_bytes in [True, False]:
+            header = Header(bitfield_header_fields, bitfield_header_length, swap_field_bytes)
+            self.assertFalse(header.is_byte_aligned())
+            self.loopback_test(dw=32, header=header)
+
+    def test_single_beat_header_loopback(self):
+        header = Header(single_beat_header_fields, single_beat_header_length, swap_field_bytes=True)
+        self.loopback_test(dw=128, header=header)
+
+    def test_two_beats_header_loopback(self):
+        header = Header(two_beats_header_fields, two_beats_header_length, swap_field_bytes=True)
+        self.loopback_test(dw=32, header=header)